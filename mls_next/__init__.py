@@ -0,0 +1,28 @@
+"""
+MLS NEXT CLUB CONTACT SCRAPER
+=============================
+Paquete que reúne los scrapers v1 y v2 en un único motor por etapas:
+
+    fuente -> resolución -> descubrimiento -> descarga -> extracción
+           -> clasificación -> salida
+
+USO:
+    python -m mls_next                      # resolución por Google (v2)
+    python -m mls_next --estrategia dominio # dominios adivinados (v1)
+    TRAZAR_WEBDRIVER=1 python -m mls_next   # con perfil de comandos WebDriver
+    METRICAS_PUERTO=9108 python -m mls_next # con endpoint /metrics en vivo
+"""
+
+from .clubes import obtener_lista_clubes
+from .extraccion import extraer_emails, extraer_telefonos, clasificar_emails
+from .motor import Etapa, ejecutar
+from .pipeline import TrabajoClub, crear_etapas, fuente_clubes
+from .principal import main
+from .resolucion import ESTRATEGIAS, EstrategiaGoogle, EstrategiaDominio
+
+__all__ = [
+    'obtener_lista_clubes', 'extraer_emails', 'extraer_telefonos',
+    'clasificar_emails', 'Etapa', 'ejecutar', 'TrabajoClub', 'crear_etapas',
+    'fuente_clubes', 'main', 'ESTRATEGIAS', 'EstrategiaGoogle',
+    'EstrategiaDominio',
+]
@@ -0,0 +1,48 @@
+import argparse
+
+from .config import LIMITE, POOL_DRIVERS, WORKERS
+from .principal import main
+from .resolucion import ESTRATEGIAS
+
+
+def _argumentos():
+    parser = argparse.ArgumentParser(prog='python -m mls_next')
+    parser.add_argument('--estrategia', choices=sorted(ESTRATEGIAS), default='google',
+                        help='cómo encontrar el website de cada club')
+    parser.add_argument('--salida', default=None,
+                        help='archivo Excel de salida (por defecto '
+                             'mls_next_contacts_v2.xlsx con google y '
+                             'mls_next_contacts.xlsx con dominio)')
+    parser.add_argument('--limite', type=int, default=LIMITE,
+                        help='cantidad de clubes a procesar (0 = todos)')
+    parser.add_argument('--drivers', type=int, default=POOL_DRIVERS,
+                        help='navegadores Chrome en paralelo')
+    parser.add_argument('--workers', action='append', default=[], metavar='ETAPA=N',
+                        help=f"workers de una etapa ({', '.join(WORKERS)}); repetible")
+    parser.add_argument('--metricas-puerto', type=int, default=None,
+                        help='puerto local del endpoint /metrics de Prometheus '
+                             '(por defecto METRICAS_PUERTO)')
+    return parser.parse_args()
+
+
+def _workers(valores):
+    workers = {}
+    for valor in valores:
+        etapa, _, n = valor.partition('=')
+        if etapa not in WORKERS or not n.isdigit() or int(n) < 1:
+            raise SystemExit(f"--workers inválido: {valor}")
+        workers[etapa] = int(n)
+    return workers
+
+
+def _puerto(valor):
+    if valor is not None and not 0 < valor < 65536:
+        raise SystemExit(f"--metricas-puerto inválido: {valor} (debe ser un puerto entre 1 y 65535)")
+    return valor
+
+
+if __name__ == "__main__":
+    args = _argumentos()
+    main(estrategia=args.estrategia, output_file=args.salida,
+         limite=args.limite, drivers=args.drivers, workers=_workers(args.workers),
+         metricas_puerto=_puerto(args.metricas_puerto))
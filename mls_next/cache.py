@@ -0,0 +1,183 @@
+"""
+Caché en memoria con semántica single-flight
+============================================
+Muchos clubes comparten sitio (los ALBION SC, Cedar Stars, los Sporting...).
+El caché evita que dos workers descarguen la misma página en una corrida.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
+
+from .config import (
+    CACHE_MAX_PAGINAS, SUFIJOS_COMPUESTOS,
+    PLATAFORMAS_COMPARTIDAS, PALABRAS_GENERICAS
+)
+
+
+class _Vuelo:
+    """Carga en curso de una clave: los demás workers esperan su resultado"""
+
+    def __init__(self):
+        self.evento = threading.Event()
+        self.valor = None
+        self.error = None
+
+
+class CacheSingleFlight:
+    """Caché LRU acotado y thread-safe con semántica single-flight.
+
+    Si varios workers piden la misma clave a la vez, solo uno ejecuta la
+    carga y el resto espera y reutiliza ese resultado.
+    """
+
+    def __init__(self, max_items):
+        self.max_items = max_items
+        self._datos = OrderedDict()
+        self._en_vuelo = {}
+        self._lock = threading.Lock()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave, cargar):
+        """Devuelve el valor de `clave`, llamando a `cargar()` solo si hace falta"""
+        return self.obtener_con_estado(clave, cargar)[0]
+
+    def obtener_con_estado(self, clave, cargar):
+        """Como `obtener`, pero devuelve (valor, acierto). `acierto` es False
+        solo para el worker que ejecutó la carga"""
+        with self._lock:
+            if clave in self._datos:
+                self._datos.move_to_end(clave)
+                self.aciertos += 1
+                return self._datos[clave], True
+
+            vuelo = self._en_vuelo.get(clave)
+            es_lider = vuelo is None
+            if es_lider:
+                vuelo = _Vuelo()
+                self._en_vuelo[clave] = vuelo
+                self.fallos += 1
+            else:
+                self.aciertos += 1
+
+        if not es_lider:
+            vuelo.evento.wait()
+            if vuelo.error is not None:
+                raise vuelo.error
+            return vuelo.valor, True
+
+        try:
+            vuelo.valor = cargar()
+        except Exception as e:
+            vuelo.error = e
+            raise
+        finally:
+            with self._lock:
+                if vuelo.error is None:
+                    self._datos[clave] = vuelo.valor
+                    self._datos.move_to_end(clave)
+                    while len(self._datos) > self.max_items:
+                        self._datos.popitem(last=False)
+                del self._en_vuelo[clave]
+            vuelo.evento.set()
+
+        return vuelo.valor, False
+
+    def __contains__(self, clave):
+        with self._lock:
+            return clave in self._datos
+
+
+CACHE_PAGINAS = CacheSingleFlight(CACHE_MAX_PAGINAS)
+
+
+def normalizar_url(url):
+    """Normaliza una URL para usarla como clave de caché"""
+    partes = urlparse(url.strip())
+    host = (partes.hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+    if partes.port and partes.port not in (80, 443):
+        host = f"{host}:{partes.port}"
+
+    path = partes.path.rstrip('/')
+    query = urlencode(sorted(parse_qsl(partes.query, keep_blank_values=True)))
+
+    # http y https apuntan al mismo contenido para nuestro propósito
+    return urlunparse(('https', host, path, '', query, ''))
+
+
+def dominio_registrable(url):
+    """Devuelve el dominio registrable (ej: albionsc.org) de una URL"""
+    host = (urlparse(url).hostname or '').lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    for plataforma in PLATAFORMAS_COMPARTIDAS:
+        if host == plataforma or host.endswith('.' + plataforma):
+            return host
+
+    partes = host.split('.')
+    niveles = 3 if '.'.join(partes[-2:]) in SUFIJOS_COMPUESTOS else 2
+    return '.'.join(partes[-niveles:])
+
+
+def _palabras_club(club_name):
+    """Palabras del nombre que sirven para distinguir al club"""
+    return [
+        p for p in re.findall(r'[a-z0-9]+', club_name.lower())
+        if len(p) > 2 and p not in PALABRAS_GENERICAS
+    ]
+
+
+def palabras_hermanos(club_name, clubes):
+    """Palabras que distinguen a los clubes hermanos de `club_name` en la corrida.
+
+    Hermanos son los clubes que empiezan con la misma palabra (ej: los
+    ALBION SC). Para "ALBION SC Denver" devuelve "boulder", "county",
+    "vegas", "angeles", "diego"... Las palabras muy cortas ("las", "los",
+    "san") se descartan porque aparecen dentro de cualquier email.
+    """
+    propias = _palabras_club(club_name)
+    if not propias:
+        return []
+
+    ajenas = []
+    for otro in clubes:
+        palabras = _palabras_club(otro)
+        if otro == club_name or not palabras or palabras[0] != propias[0]:
+            continue
+        ajenas.extend(p for p in palabras[1:] if len(p) > 3 and p not in propias and p not in ajenas)
+    return ajenas
+
+
+def sitio_de_hermanos(club_name, website):
+    """True si el website es el sitio común de un grupo de clubes hermanos:
+    la primera palabra del club aparece en el dominio (ej: "ALBION SC
+    Denver" en albionsc.org). En dominios genéricos (mlssoccer.com,
+    weebly.com...) cada club se trata por separado.
+    """
+    dominio = dominio_registrable(website)
+    palabras = _palabras_club(club_name)
+    return bool(palabras) and palabras[0] in dominio.replace('-', '')
+
+
+def filtrar_emails_por_club(emails, club_name, website, hermanos):
+    """Se queda con los emails del club dentro del sitio de sus hermanos.
+
+    Ej: en albionsc.org, "ALBION SC Denver" descarta los emails que nombran
+    a otro hermano (vegas@..., doc.diego@...) y pone primero los que
+    mencionan "denver". Los emails generales del dominio (info@...) se
+    conservan detrás.
+    """
+    dominio = dominio_registrable(website)
+    propias = [p for p in _palabras_club(club_name) if p not in dominio]
+    ajenas = [p for p in hermanos if p not in dominio]
+
+    def es_propio(email):
+        return any(p in email for p in propias)
+
+    filtrados = [e for e in emails if es_propio(e) or not any(p in e for p in ajenas)]
+    return sorted(filtrados, key=lambda e: not es_propio(e))
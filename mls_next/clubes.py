@@ -0,0 +1,47 @@
+"""
+Fuente de clubes de MLS NEXT
+"""
+
+
+def obtener_lista_clubes():
+    """Retorna la lista de clubes de MLS NEXT (extraída previamente de
+    https://www.mlssoccer.com/mlsnext/academy-division/members)"""
+    return [
+        "956 United", "AC River", "AFC Lightning", "ALBION SC Boulder County",
+        "ALBION SC Denver", "ALBION SC Las Vegas", "ALBION SC Los Angeles",
+        "ALBION SC San Diego", "Alexandria SA", "Almaden FC", "Aspire FC",
+        "Baltimore Armour", "Barca Residency Academy", "Bayside FC",
+        "Beachside of Connecticut", "Beadling SC", "Bethesda SC",
+        "Broomfield Soccer Club", "Capital City SC", "Carolina Core FC",
+        "Cedar Stars Academy Bergen", "Cedar Stars Academy Monmouth",
+        "Charleston SC", "Charlotte Independence SC", "Chicago FC United",
+        "Chicago Fire Youth SC", "Cincinnati United Premier",
+        "City SC San Diego", "Classic FC", "Club Ohio", "Colorado United SC",
+        "Connecticut Rush", "Coppermine SC", "Dallas Hornets",
+        "De Anza Force", "Downtown United Soccer Club", "Elmbrook United",
+        "FC Bay Area Surf", "FC DELCO", "FC Golden State Force",
+        "FC Greater Boston Bolts", "FC Richmond", "FC Tucson Youth",
+        "FC Westchester", "Forward Madison FC", "Galaxy Soccer Club",
+        "Hoover-Vestavia Soccer", "Houston Rangers", "IMG Academy",
+        "Indy Eleven", "Inter Atlanta FC", "Jacksonville FC",
+        "Keystone FC", "Kings Hammer Cincinnati", "LA Surf Soccer Club",
+        "Lamorinda Soccer Club", "Las Vegas Sports Academy",
+        "Long Island Soccer Club", "Los Angeles Soccer Club",
+        "Lou Fusz Athletic", "Loudoun Soccer Club", "Louisiana Elite",
+        "McLean Youth Soccer", "Michigan Jaguars", "Michigan Tigers FC",
+        "Midwest United FC", "New Mexico Soccer Academy", "New York SC",
+        "Oakwood Soccer Club", "One Knoxville SC", "Orlando City Youth SC",
+        "PA Classics", "Phoenix Rising FC", "Real Futbol Academy",
+        "Rhode Island Surf SC", "RSL Arizona", "Sacramento United",
+        "San Francisco Glens SC", "SC Del Sol", "SC Wave", "Seacoast United",
+        "Seattle Celtic", "Silicon Valley Soccer Academy", "SoCal Reds FC",
+        "Sockers FC Chicago", "Sporting Athletic Club", "Sporting City",
+        "Sporting Oklahoma", "Sporting San Diego", "Springfield SYC",
+        "St. Louis Development Academy", "St. Louis Scott Gallagher",
+        "Sting Nebraska", "Strikers FC", "Syracuse Development Academy",
+        "Tampa Bay United", "The St. James", "Tonka Fusion Elite",
+        "Tormenta FC Academy", "Triangle United", "TSF Academy",
+        "Tulsa Greenwood SC", "Vardar Soccer Club", "Ventura County Fusion",
+        "Virginia Revolution SC", "Wake FC", "Wasatch SC", "Washington Rush",
+        "West Florida Flames", "Westside Metros FC", "Wisconsin United FC"
+    ]
@@ -0,0 +1,116 @@
+"""
+Configuración compartida del scraper de MLS NEXT
+"""
+
+import re
+
+# ============================================
+# CONFIGURACIÓN
+# ============================================
+
+# Tiempo de espera para que carguen los resultados de Google (segundos)
+DELAY = 2
+
+# Separación mínima entre dos búsquedas en Google, sumando todos los
+# workers y navegadores (segundos). Más seguido Google pide CAPTCHA.
+INTERVALO_GOOGLE = 6
+
+# Espera después de cargar una página para que renderice (segundos)
+ESPERA_PRINCIPAL = 2
+ESPERA_SECUNDARIA = 1.5
+
+# Guardar progreso cada N clubes
+GUARDAR_CADA = 5
+
+# Límite de prueba (None para procesar todos)
+LIMITE = 10
+
+# Patrones para encontrar emails y teléfonos
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+PHONE_PATTERN = re.compile(r'[\(]?[0-9]{3}[\)]?[-\s\.]?[0-9]{3}[-\s\.]?[0-9]{4}')
+
+# Fragmentos que indican un email falso (imágenes, placeholders, servicios)
+EMAILS_INVALIDOS = [
+    '.png', '.jpg', '.gif', '.svg', 'example.com', 'domain.com',
+    'email.com', 'wixpress', 'sentry', 'cloudflare', 'googleapis'
+]
+
+# Palabras clave para clasificar emails
+DIRECTOR_KEYWORDS = ['director', 'doc', 'president', 'executive', 'coach', 'technical', 'admin']
+CLUB_KEYWORDS = ['info', 'contact', 'office', 'hello', 'general', 'registration', 'register']
+
+# Palabras clave de links a páginas de contacto/staff, con su prioridad:
+# las páginas de staff/directorio suelen tener los emails de director
+KEYWORDS_CONTACTO = {
+    'staff': 5,
+    'directory': 5,
+    'contact': 4,
+    'leadership': 3,
+    'admin': 3,
+    'club-info': 2,
+    'coaches': 2,
+    'about': 1,
+    'team': 1,
+}
+
+# Cuánto suma a la prioridad la tasa de aciertos aprendida (0 a 1) de cada
+# palabra clave en corridas anteriores
+PESO_APRENDIDO = 4
+
+# Archivo donde se guardan las tasas de aciertos entre corridas
+TASAS_FILE = "frontera_tasas.json"
+
+# Palabras que indican que una página es de un club de fútbol
+KEYWORDS_SOCCER = ['soccer', 'football', 'club', 'team', 'academy', 'player']
+
+# Dominios a ignorar en búsqueda de Google
+DOMINIOS_IGNORAR = [
+    'facebook.com', 'twitter.com', 'instagram.com', 'linkedin.com',
+    'youtube.com', 'tiktok.com', 'yelp.com', 'yellowpages.com',
+    'mapquest.com', 'google.com', 'wikipedia.org', 'hugedomains.com',
+    'godaddy.com', 'wix.com', 'soccerwire.com', 'topdrawersoccer.com'
+]
+
+# ============================================
+# MOTOR
+# ============================================
+
+# Tamaño máximo de cada cola entre etapas (acota la memoria)
+TAMANO_COLA = 8
+
+# Navegadores Chrome compartidos por las etapas que usan el driver
+POOL_DRIVERS = 2
+
+# Workers por etapa (cada etapa escala por separado)
+WORKERS = {
+    'resolucion': 1,
+    'descubrimiento': 2,
+    'descarga': 2,
+    'extraccion': 1,
+    'clasificacion': 1,
+}
+
+# ============================================
+# CACHÉ
+# ============================================
+
+# Caché en memoria de páginas (solo dura la corrida). Guarda el HTML
+# completo, así que el límite es chico.
+CACHE_MAX_PAGINAS = 64
+
+# Sufijos de dos niveles (ej: club.co.uk) para calcular el dominio registrable
+SUFIJOS_COMPUESTOS = ['co.uk', 'org.uk', 'com.au', 'com.mx', 'com.ar', 'co.nz']
+
+# Plataformas donde cada club tiene su propio subdominio: el dominio
+# registrable no identifica al club, así que se usa el host completo
+PLATAFORMAS_COMPARTIDAS = [
+    'sportngin.com', 'sportsengine.com', 'leagueapps.com', 'teamsnap.com',
+    'demosphere-secure.com', 'bluesombrero.com', 'stacksports.com',
+    'gotsport.com', 'wixsite.com', 'squarespace.com'
+]
+
+# Palabras del nombre del club que no sirven para distinguir clubes hermanos
+PALABRAS_GENERICAS = [
+    'sc', 'fc', 'ac', 'afc', 'soccer', 'club', 'academy', 'united', 'youth',
+    'the', 'of', 'and', 'elite', 'premier', 'development', 'residency'
+]
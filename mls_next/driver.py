@@ -0,0 +1,93 @@
+"""
+Navegadores Chrome del scraper
+"""
+
+import queue
+import threading
+from contextlib import contextmanager
+from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
+from webdriver_manager.chrome import ChromeDriverManager
+
+from .trazado import trazar_driver
+
+
+def crear_driver(headless=False):
+    """Crea y configura el driver de Chrome"""
+    print("Iniciando Chrome...")
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument('--headless')
+    options.add_argument('--disable-gpu')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    # Evitar detección de bot
+    options.add_argument('--disable-blink-features=AutomationControlled')
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+
+    driver = webdriver.Chrome(
+        service=Service(ChromeDriverManager().install()),
+        options=options
+    )
+    return trazar_driver(driver)
+
+
+class PoolDrivers:
+    """Pool acotado de navegadores compartido por las etapas del motor.
+
+    Los drivers se crean a demanda hasta `tamano`; un worker que pide uno
+    cuando están todos ocupados espera a que otro lo devuelva.
+    """
+
+    def __init__(self, tamano, crear=crear_driver):
+        self.tamano = tamano
+        self._crear = crear
+        self._libres = queue.Queue()
+        self._todos = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def usar(self):
+        """Presta un driver mientras dura el bloque `with`"""
+        driver = self._tomar()
+        try:
+            yield driver
+        finally:
+            self._libres.put(driver)
+
+    def _tomar(self):
+        try:
+            return self._libres.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            if len(self._todos) < self.tamano:
+                driver = self._crear()
+                self._todos.append(driver)
+                return driver
+
+        return self._libres.get()
+
+    def pids(self):
+        """PIDs de los chromedriver creados (Chrome cuelga de ellos)"""
+        with self._lock:
+            drivers = list(self._todos)
+
+        pids = []
+        for driver in drivers:
+            try:
+                pids.append(driver.service.process.pid)
+            except AttributeError:
+                continue
+        return pids
+
+    def cerrar(self):
+        """Cierra todos los navegadores creados"""
+        with self._lock:
+            drivers, self._todos = self._todos, []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
@@ -0,0 +1,120 @@
+"""
+Extracción y clasificación de contactos
+=======================================
+Funciones puras sobre el HTML ya descargado: no tocan el driver, así que
+se pueden correr en su propia etapa sin ocupar un navegador.
+"""
+
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from .config import (
+    EMAIL_PATTERN, PHONE_PATTERN, EMAILS_INVALIDOS, DIRECTOR_KEYWORDS,
+    CLUB_KEYWORDS
+)
+
+
+def extraer_emails(html):
+    """Extrae todos los emails de un HTML"""
+    emails = set()
+
+    for email in EMAIL_PATTERN.findall(html.lower()):
+        # Filtrar emails inválidos
+        if not any(x in email for x in EMAILS_INVALIDOS):
+            emails.add(email)
+
+    return list(emails)
+
+
+def extraer_telefonos(html):
+    """Extrae teléfonos de un HTML"""
+    phones = set()
+
+    for phone in PHONE_PATTERN.findall(html):
+        clean = re.sub(r'[^\d]', '', phone)
+        if len(clean) >= 10:
+            phones.add(phone)
+
+    return list(phones)
+
+
+class _ColectorEnlaces(HTMLParser):
+    """Junta (href, texto) de cada <a> del documento"""
+
+    def __init__(self):
+        super().__init__()
+        self.enlaces = []
+        self._actual = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            self._actual = [dict(attrs).get('href') or '', []]
+
+    def handle_data(self, data):
+        if self._actual is not None:
+            self._actual[1].append(data)
+
+    def handle_endtag(self, tag):
+        if tag == 'a' and self._actual is not None:
+            href, texto = self._actual
+            self.enlaces.append((href, ' '.join(''.join(texto).split())))
+            self._actual = None
+
+
+def extraer_enlaces(html, base_url):
+    """Devuelve los links de la página como (url absoluta, texto)"""
+    colector = _ColectorEnlaces()
+    try:
+        colector.feed(html)
+        colector.close()
+    except Exception:
+        pass
+
+    enlaces = []
+    for href, texto in colector.enlaces:
+        if not href or href.startswith(('mailto:', 'tel:', 'javascript:', '#')):
+            continue
+        enlaces.append((urljoin(base_url, href), texto))
+    return enlaces
+
+
+def clasificar_emails(emails):
+    """Clasifica emails por tipo (director vs general)"""
+    director_email = None
+    club_email = None
+
+    for email in emails:
+        email_lower = email.lower()
+
+        if not director_email:
+            for kw in DIRECTOR_KEYWORDS:
+                if kw in email_lower:
+                    director_email = email
+                    break
+
+        if not club_email:
+            for kw in CLUB_KEYWORDS:
+                if kw in email_lower:
+                    club_email = email
+                    break
+
+    # Si no encontramos específicos, usar el primero
+    if not director_email and not club_email and emails:
+        club_email = emails[0]
+
+    return director_email, club_email
+
+
+def es_email_de_contacto(email):
+    """True si el email parece de director o de contacto general del club"""
+    email_lower = email.lower()
+    return any(kw in email_lower for kw in DIRECTOR_KEYWORDS + CLUB_KEYWORDS)
+
+
+def contactos_completos(emails, telefonos):
+    """True si ya hay email de director y de club identificados por palabra
+    clave (no el primero que aparezca) y un teléfono: no hace falta seguir
+    buscando"""
+    director_email, club_email = clasificar_emails(emails)
+    return bool(director_email and club_email and telefonos)
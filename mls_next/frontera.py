@@ -0,0 +1,124 @@
+"""
+Frontera priorizada de páginas por club
+=======================================
+En lugar de visitar los links de contacto en el orden del DOM, cada
+candidato se puntúa por la palabra clave que lo trajo (staff/directory/
+contact pesan más que about/team) más la tasa de aciertos que esa palabra
+tuvo en corridas anteriores. El pipeline visita las páginas de mayor
+puntaje primero y corta apenas tiene los dos contactos del club.
+"""
+
+import heapq
+import json
+import os
+import threading
+from urllib.parse import urlparse
+
+from .cache import normalizar_url
+from .config import KEYWORDS_CONTACTO, PESO_APRENDIDO, TASAS_FILE
+
+
+class TasasAprendidas:
+    """Tasa de aciertos por palabra clave, persistida entre corridas.
+
+    Un acierto es una página que aportó un email de director o de club
+    que el club todavía no tenía.
+    """
+
+    def __init__(self, filename=TASAS_FILE):
+        self.filename = filename
+        self._lock = threading.Lock()
+        # keyword -> [visitas, aciertos]
+        self._stats = {}
+        self._cambios = False
+
+        if filename and os.path.exists(filename):
+            try:
+                with open(filename, encoding='utf-8') as f:
+                    self._stats = {k: list(v) for k, v in json.load(f).items()}
+            except (OSError, ValueError):
+                print(f"    No se pudo leer {filename}, se empieza de cero")
+
+    def tasa(self, keyword):
+        """Tasa suavizada (Laplace): 0.5 para una palabra nunca vista"""
+        with self._lock:
+            visitas, aciertos = self._stats.get(keyword, (0, 0))
+        return (aciertos + 1) / (visitas + 2)
+
+    def registrar(self, keywords, acierto):
+        with self._lock:
+            for keyword in keywords:
+                stats = self._stats.setdefault(keyword, [0, 0])
+                stats[0] += 1
+                stats[1] += int(acierto)
+            self._cambios = True
+
+    def guardar(self):
+        """Escribe las tasas si la corrida registró visitas nuevas"""
+        if not self.filename:
+            return
+        with self._lock:
+            if not self._cambios:
+                return
+            datos = dict(self._stats)
+            self._cambios = False
+        with open(self.filename, 'w', encoding='utf-8') as f:
+            json.dump(datos, f, indent=2, sort_keys=True)
+
+
+TASAS = TasasAprendidas()
+
+
+def palabras_clave(href, texto):
+    """Palabras clave de contacto presentes en la URL o el texto del link"""
+    href = href.lower()
+    texto = texto.lower()
+    return [kw for kw in KEYWORDS_CONTACTO if kw in href or kw in texto]
+
+
+class FronteraClub:
+    """Cola de prioridad de las páginas candidatas de un club"""
+
+    def __init__(self, tasas=TASAS):
+        self.tasas = tasas
+        self._heap = []
+        self._vistas = set()
+        self._orden = 0
+
+    def puntaje(self, keywords):
+        return max(
+            KEYWORDS_CONTACTO[kw] + PESO_APRENDIDO * self.tasas.tasa(kw)
+            for kw in keywords
+        )
+
+    def marcar_vista(self, url):
+        self._vistas.add(normalizar_url(url))
+
+    def agregar_enlaces(self, enlaces, base_url, mismo_dominio=True):
+        """Encola los links de contacto/staff de una página"""
+        dominio_base = urlparse(base_url).netloc
+
+        for href, texto in enlaces:
+            # Verificar que sea del mismo dominio
+            if mismo_dominio and urlparse(href).netloc != dominio_base:
+                continue
+
+            keywords = palabras_clave(href, texto)
+            clave = normalizar_url(href)
+            if not keywords or clave in self._vistas:
+                continue
+
+            self._vistas.add(clave)
+            # El orden de llegada desempata (respeta el orden del DOM)
+            heapq.heappush(self._heap, (-self.puntaje(keywords), self._orden, href, keywords))
+            self._orden += 1
+
+    def siguiente(self):
+        """Devuelve (url, keywords) del mejor candidato, o None si no quedan"""
+        if not self._heap:
+            return None
+        _, _, href, keywords = heapq.heappop(self._heap)
+        return href, keywords
+
+    def __len__(self):
+        return len(self._heap)
@@ -0,0 +1,290 @@
+"""
+Métricas en vivo (formato Prometheus)
+=====================================
+Endpoint HTTP local y opcional para seguir una corrida larga mientras
+avanza: clubes completados/fallidos, páginas descargadas, workers en
+curso, latencia por etapa, memoria de los navegadores y profundidad de
+las colas.
+
+USO:
+    METRICAS_PUERTO=9108 python -m mls_next
+    curl http://127.0.0.1:9108/metrics
+"""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+try:
+    import psutil
+except ImportError:  # opcional: sin psutil se lee /proc (solo Linux)
+    psutil = None
+
+# ============================================
+# CONFIGURACIÓN
+# ============================================
+
+METRICAS_HOST = "127.0.0.1"
+
+# Límites (segundos) de los buckets del histograma de latencia por etapa
+BUCKETS_LATENCIA = (0.1, 0.5, 1, 2, 5, 10, 20, 30, 60, 120)
+
+
+# ============================================
+# REGISTRO
+# ============================================
+
+class _Histograma:
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.conteos = [0] * len(buckets)
+        self.suma = 0.0
+        self.total = 0
+
+    def observar(self, valor):
+        for i, limite in enumerate(self.buckets):
+            if valor <= limite:
+                self.conteos[i] += 1
+        self.suma += valor
+        self.total += 1
+
+
+class Metricas:
+    """Contadores, gauges e histogramas de la corrida (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.inicio = time.time()
+        self.clubes_completados = 0
+        self.clubes_fallidos = 0
+        self.paginas_descargadas = 0
+        self._en_curso = {}
+        self._latencias = {}
+        # Funciones que se evalúan al momento de exportar
+        self._colas = {}
+        self._caches = {}
+        self._pids_navegadores = lambda: []
+
+    # Contadores
+
+    def club_terminado(self, fallido):
+        with self._lock:
+            self.clubes_completados += 1
+            self.clubes_fallidos += int(fallido)
+
+    def pagina_descargada(self):
+        with self._lock:
+            self.paginas_descargadas += 1
+
+    # Etapas
+
+    def entrar_etapa(self, etapa):
+        with self._lock:
+            self._en_curso[etapa] = self._en_curso.get(etapa, 0) + 1
+
+    def salir_etapa(self, etapa):
+        with self._lock:
+            self._en_curso[etapa] -= 1
+
+    def observar_etapa(self, etapa, segundos):
+        with self._lock:
+            if etapa not in self._latencias:
+                self._latencias[etapa] = _Histograma(BUCKETS_LATENCIA)
+                self._en_curso.setdefault(etapa, 0)
+            self._latencias[etapa].observar(segundos)
+
+    # Gauges calculados
+
+    def registrar_cola(self, nombre, profundidad):
+        """`profundidad` es una función que devuelve los items en espera"""
+        self._colas[nombre] = profundidad
+
+    def registrar_cache(self, nombre, cache):
+        self._caches[nombre] = cache
+
+    def registrar_navegadores(self, pids):
+        """`pids` es una función que devuelve los PIDs de los chromedriver"""
+        self._pids_navegadores = pids
+
+    # Exportación
+
+    def exportar(self):
+        """Devuelve todas las métricas en formato de texto de Prometheus"""
+        lineas = []
+
+        def metrica(nombre, tipo, ayuda, muestras):
+            lineas.append(f"# HELP {nombre} {ayuda}")
+            lineas.append(f"# TYPE {nombre} {tipo}")
+            for etiquetas, valor in muestras:
+                lineas.append(f"{nombre}{_etiquetas(etiquetas)} {_numero(valor)}")
+
+        with self._lock:
+            completados = self.clubes_completados
+            fallidos = self.clubes_fallidos
+            paginas = self.paginas_descargadas
+            en_curso = dict(self._en_curso)
+            latencias = {
+                etapa: (list(h.conteos), h.suma, h.total)
+                for etapa, h in self._latencias.items()
+            }
+
+        metrica("mls_next_clubes_completados_total", "counter",
+                "Clubes que llegaron a la salida", [({}, completados)])
+        metrica("mls_next_clubes_fallidos_total", "counter",
+                "Clubes que terminaron con error", [({}, fallidos)])
+        metrica("mls_next_paginas_descargadas_total", "counter",
+                "Páginas descargadas con el navegador (sin contar el caché)",
+                [({}, paginas)])
+        metrica("mls_next_workers_en_curso", "gauge",
+                "Workers procesando un club en cada etapa",
+                [({'etapa': e}, n) for e, n in sorted(en_curso.items())])
+        metrica("mls_next_cola_profundidad", "gauge",
+                "Items esperando en la cola de entrada de cada etapa",
+                [({'cola': n}, profundidad()) for n, profundidad in self._colas.items()])
+        metrica("mls_next_cache_aciertos_total", "counter",
+                "Aciertos de los cachés en memoria",
+                [({'cache': n}, c.aciertos) for n, c in self._caches.items()])
+        metrica("mls_next_navegadores_rss_bytes", "gauge",
+                "Memoria residente de los navegadores (chromedriver + Chrome)",
+                [({}, rss_navegadores(self._pids_navegadores()))])
+        metrica("mls_next_uptime_segundos", "gauge",
+                "Segundos desde el inicio de la corrida",
+                [({}, time.time() - self.inicio)])
+
+        lineas.append("# HELP mls_next_etapa_segundos Latencia por club de cada etapa")
+        lineas.append("# TYPE mls_next_etapa_segundos histogram")
+        for etapa, (conteos, suma, total) in sorted(latencias.items()):
+            for limite, conteo in zip(BUCKETS_LATENCIA, conteos):
+                etiquetas = _etiquetas({'etapa': etapa, 'le': _numero(limite)})
+                lineas.append(f"mls_next_etapa_segundos_bucket{etiquetas} {conteo}")
+            etiquetas = _etiquetas({'etapa': etapa, 'le': '+Inf'})
+            lineas.append(f"mls_next_etapa_segundos_bucket{etiquetas} {total}")
+            lineas.append(f"mls_next_etapa_segundos_sum{_etiquetas({'etapa': etapa})} {_numero(suma)}")
+            lineas.append(f"mls_next_etapa_segundos_count{_etiquetas({'etapa': etapa})} {total}")
+
+        return '\n'.join(lineas) + '\n'
+
+
+METRICAS = Metricas()
+
+
+def _etiquetas(etiquetas):
+    if not etiquetas:
+        return ''
+    partes = []
+    for k, v in etiquetas.items():
+        v = str(v).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+        partes.append(f'{k}="{v}"')
+    return '{' + ','.join(partes) + '}'
+
+
+def _numero(valor):
+    if isinstance(valor, float):
+        return repr(round(valor, 6))
+    return str(valor)
+
+
+def puerto_desde_entorno():
+    """Puerto de METRICAS_PUERTO, o None si no está definido"""
+    valor = os.environ.get('METRICAS_PUERTO', '').strip()
+    if not valor:
+        return None
+    if not valor.isdigit() or not 0 < int(valor) < 65536:
+        raise SystemExit(
+            f"METRICAS_PUERTO inválido: {valor!r} (debe ser un puerto entre 1 y 65535)"
+        )
+    return int(valor)
+
+
+# ============================================
+# MEMORIA DE LOS NAVEGADORES
+# ============================================
+
+def rss_navegadores(pids):
+    """Suma el RSS de cada chromedriver y todos sus procesos hijos (Chrome)"""
+    if psutil is not None:
+        return _rss_psutil(pids)
+    return _rss_proc(pids)
+
+
+def _rss_psutil(pids):
+    total = 0
+    for pid in pids:
+        try:
+            proceso = psutil.Process(pid)
+            for p in [proceso] + proceso.children(recursive=True):
+                try:
+                    total += p.memory_info().rss
+                except psutil.Error:
+                    continue
+        except psutil.Error:
+            continue
+    return total
+
+
+def _rss_proc(pids):
+    if not pids or not os.path.isdir('/proc'):
+        return 0
+
+    # Armar el árbol padre -> hijos una sola vez
+    hijos = {}
+    for entrada in os.listdir('/proc'):
+        if not entrada.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entrada}/stat') as f:
+                # El nombre del proceso va entre paréntesis y puede tener espacios
+                ppid = int(f.read().rsplit(')', 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        hijos.setdefault(ppid, []).append(int(entrada))
+
+    total = 0
+    pendientes = list(pids)
+    while pendientes:
+        pid = pendientes.pop()
+        pendientes.extend(hijos.get(pid, []))
+        try:
+            with open(f'/proc/{pid}/status') as f:
+                for linea in f:
+                    if linea.startswith('VmRSS:'):
+                        total += int(linea.split()[1]) * 1024
+                        break
+        except (OSError, ValueError):
+            continue
+    return total
+
+
+# ============================================
+# SERVIDOR HTTP
+# ============================================
+
+class _Handler(BaseHTTPRequestHandler):
+
+    def do_GET(self):
+        if self.path.split('?')[0] not in ('/metrics', '/'):
+            self.send_error(404)
+            return
+
+        cuerpo = METRICAS.exportar().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(cuerpo)))
+        self.end_headers()
+        self.wfile.write(cuerpo)
+
+    def log_message(self, format, *args):
+        # No ensuciar la consola del scraper con cada scrape de Prometheus
+        pass
+
+
+def iniciar_servidor(puerto, host=METRICAS_HOST):
+    """Levanta el endpoint /metrics en un thread de fondo y lo devuelve"""
+    servidor = ThreadingHTTPServer((host, puerto), _Handler)
+    servidor.daemon_threads = True
+    thread = threading.Thread(target=servidor.serve_forever, name='metricas', daemon=True)
+    thread.start()
+    print(f"Métricas en http://{host}:{servidor.server_port}/metrics")
+    return servidor
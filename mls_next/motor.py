@@ -0,0 +1,163 @@
+"""
+Motor de etapas
+===============
+Conecta una fuente con una serie de etapas mediante colas acotadas. Cada
+etapa corre en sus propios threads (`workers`), así que mientras una
+busca en Google el website del club N, otra ya descarga las páginas del
+club N-1 y otra extrae los emails del club N-2.
+
+Cada etapa es una función generadora `procesar(item)` que puede emitir
+cero, uno o varios items hacia la etapa siguiente. El resultado de
+`ejecutar()` también es un generador: la salida se consume a medida que
+va saliendo y como las colas tienen tamaño fijo, la memoria queda acotada.
+"""
+
+import queue
+import threading
+import time
+import traceback
+
+from .config import TAMANO_COLA
+from .metricas import METRICAS
+
+# Marca de fin de stream entre etapas
+_FIN = object()
+
+
+class Etapa:
+    """Una etapa del motor.
+
+    procesar:  función generadora item -> items de salida
+    workers:   cantidad de threads que atienden la etapa
+    saltar:    predicado opcional; los items que lo cumplen pasan directo
+    al_fallar: función opcional (item, error) -> items de salida cuando
+               `procesar` lanza una excepción. Sin ella el item se descarta.
+    """
+
+    def __init__(self, nombre, procesar, workers=1, saltar=None, al_fallar=None):
+        self.nombre = nombre
+        self.procesar = procesar
+        self.workers = workers
+        self.saltar = saltar
+        self.al_fallar = al_fallar
+
+    def __repr__(self):
+        return f"Etapa({self.nombre!r}, workers={self.workers})"
+
+
+def _poner(cola, item, detener):
+    """put() bloqueante que se corta si el motor se detiene"""
+    while not detener.is_set():
+        try:
+            cola.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _sacar(cola, detener):
+    """get() bloqueante que se corta si el motor se detiene"""
+    while not detener.is_set():
+        try:
+            return cola.get(timeout=0.5)
+        except queue.Empty:
+            continue
+    return _FIN
+
+
+def _profundidad(cola):
+    """Items esperando en la cola, sin contar la marca de fin que los
+    workers dejan al terminar"""
+    with cola.mutex:
+        return sum(1 for item in cola.queue if item is not _FIN)
+
+
+def _alimentar(fuente, salida, detener):
+    try:
+        for item in fuente:
+            if not _poner(salida, item, detener):
+                return
+    finally:
+        _poner(salida, _FIN, detener)
+
+
+def _trabajar(etapa, entrada, salida, detener, restantes, lock):
+    while True:
+        item = _sacar(entrada, detener)
+
+        if item is _FIN:
+            # Devolver la marca para los otros workers de la etapa; el
+            # último en salir avisa a la etapa siguiente
+            _poner(entrada, _FIN, detener)
+            with lock:
+                restantes[0] -= 1
+                ultimo = restantes[0] == 0
+            if ultimo:
+                _poner(salida, _FIN, detener)
+            return
+
+        if etapa.saltar and etapa.saltar(item):
+            _poner(salida, item, detener)
+            continue
+
+        # La latencia no incluye el tiempo esperando lugar en la cola de salida
+        METRICAS.entrar_etapa(etapa.nombre)
+        duracion = 0.0
+        inicio = time.perf_counter()
+        try:
+            for resultado in etapa.procesar(item):
+                duracion += time.perf_counter() - inicio
+                _poner(salida, resultado, detener)
+                inicio = time.perf_counter()
+            duracion += time.perf_counter() - inicio
+        except Exception as e:
+            duracion += time.perf_counter() - inicio
+            if etapa.al_fallar is None:
+                print(f"    [{etapa.nombre}] error descartado: {e}")
+                traceback.print_exc()
+                continue
+            for resultado in etapa.al_fallar(item, e):
+                _poner(salida, resultado, detener)
+        finally:
+            METRICAS.salir_etapa(etapa.nombre)
+            METRICAS.observar_etapa(etapa.nombre, duracion)
+
+
+def ejecutar(fuente, etapas, tamano_cola=TAMANO_COLA):
+    """Corre la fuente por todas las etapas y genera los items finales"""
+    colas = [queue.Queue(maxsize=tamano_cola) for _ in range(len(etapas) + 1)]
+    detener = threading.Event()
+    threads = [
+        threading.Thread(
+            target=_alimentar, args=(fuente, colas[0], detener),
+            name='fuente', daemon=True
+        )
+    ]
+
+    for i, etapa in enumerate(etapas):
+        METRICAS.registrar_cola(etapa.nombre, lambda cola=colas[i]: _profundidad(cola))
+        restantes = [etapa.workers]
+        lock = threading.Lock()
+        for n in range(etapa.workers):
+            threads.append(threading.Thread(
+                target=_trabajar,
+                args=(etapa, colas[i], colas[i + 1], detener, restantes, lock),
+                name=f"{etapa.nombre}-{n}", daemon=True
+            ))
+
+    METRICAS.registrar_cola('salida', lambda cola=colas[-1]: _profundidad(cola))
+    for thread in threads:
+        thread.start()
+
+    try:
+        while True:
+            item = _sacar(colas[-1], detener)
+            if item is _FIN:
+                break
+            yield item
+    finally:
+        # Si el consumidor corta antes (error, Ctrl+C) se frenan los workers
+        detener.set()
+        for thread in threads:
+            thread.join(timeout=5)
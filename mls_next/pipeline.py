@@ -0,0 +1,231 @@
+"""
+Pipeline de contactos de clubes
+===============================
+Etapas del scraping armadas sobre el motor:
+
+    fuente -> resolución -> descubrimiento -> descarga -> extracción
+           -> clasificación -> salida
+
+Cada club viaja por las etapas como un `TrabajoClub`. Si una etapa lo da
+por terminado (sin website, sitio caído, error) las siguientes lo dejan
+pasar sin tocarlo hasta la salida.
+
+La descarga recorre la frontera priorizada del club y se detiene apenas
+hay email de director, email de club y teléfono, sin agotar el máximo de
+páginas.
+"""
+
+import time
+from dataclasses import dataclass, field
+
+from .cache import (
+    CACHE_PAGINAS, normalizar_url, palabras_hermanos, sitio_de_hermanos,
+    filtrar_emails_por_club
+)
+from .config import WORKERS, ESPERA_PRINCIPAL, ESPERA_SECUNDARIA
+from .extraccion import (
+    extraer_emails, extraer_telefonos, extraer_enlaces, clasificar_emails,
+    contactos_completos, es_email_de_contacto
+)
+from .frontera import TASAS, FronteraClub
+from .metricas import METRICAS
+from .motor import Etapa
+
+
+@dataclass
+class TrabajoClub:
+    """Estado de un club mientras recorre el pipeline"""
+    indice: int
+    club: str
+    website: str = ''
+    # Palabras de los clubes hermanos de la corrida (ej: los otros ALBION SC)
+    hermanos: list = field(default_factory=list)
+    # Páginas de contacto/staff candidatas, por prioridad
+    frontera: FronteraClub = None
+    # Páginas descargadas: dicts con url, titulo y html
+    paginas: list = field(default_factory=list)
+    emails: list = field(default_factory=list)
+    telefonos: list = field(default_factory=list)
+    # True si el website es el sitio común de sus clubes hermanos
+    compartido: bool = False
+    director_email: str = ''
+    club_email: str = ''
+    estado: str = ''
+    terminado: bool = False
+
+    def emails_propios(self, emails):
+        """En un sitio compartido, solo los emails de este club y los generales"""
+        if not self.compartido:
+            return list(emails)
+        return filtrar_emails_por_club(emails, self.club, self.website, self.hermanos)
+
+    def terminar(self, estado):
+        self.estado = estado
+        self.terminado = True
+
+    def como_fila(self):
+        """Fila para el Excel de salida"""
+        return {
+            'Club': self.club,
+            'Website': self.website,
+            'Paginas Revisadas': len(self.paginas) if self.website else '',
+            'Email Director': self.director_email,
+            'Email Club': self.club_email,
+            'Telefono': self.telefonos[0] if self.telefonos else '',
+            'Todos los Emails': '; '.join(self.emails[:5]),
+            'Estado': self.estado,
+        }
+
+
+def cargar_pagina(driver, url, espera):
+    """Visita una página y guarda su HTML (pasa por el caché de páginas).
+
+    Devuelve (pagina, descargada): `descargada` es False si salió del caché.
+    """
+
+    def cargar():
+        driver.get(url)
+        time.sleep(espera)
+        METRICAS.pagina_descargada()
+        return {
+            'url': driver.current_url,
+            'titulo': driver.title,
+            'html': driver.page_source,
+        }
+
+    pagina, acierto = CACHE_PAGINAS.obtener_con_estado(normalizar_url(url), cargar)
+    return pagina, not acierto
+
+
+def datos_pagina(pagina):
+    """Emails y teléfonos de una página (se calculan una sola vez)"""
+    if 'emails' not in pagina:
+        pagina['telefonos'] = extraer_telefonos(pagina['html'])
+        pagina['emails'] = extraer_emails(pagina['html'])
+    return pagina['emails'], pagina['telefonos']
+
+
+def fuente_clubes(clubes):
+    """Etapa inicial: un trabajo por club"""
+    for i, club in enumerate(clubes):
+        yield TrabajoClub(indice=i, club=club, hermanos=palabras_hermanos(club, clubes))
+
+
+def crear_etapas(estrategia, pool, workers=None):
+    """Arma las etapas del pipeline para una estrategia de resolución"""
+    workers = {**WORKERS, **(workers or {})}
+
+    def resolver(trabajo):
+        # Esperar el turno antes de tomar un navegador del pool
+        estrategia.esperar_turno()
+        with pool.usar() as driver:
+            website = estrategia.resolver(driver, trabajo.club)
+
+        if not website:
+            trabajo.terminar('Website no encontrado')
+            yield trabajo
+            return
+
+        trabajo.website = website
+        # Los clubes hermanos recorren cada uno su propio website; las páginas
+        # comunes del sitio (staff, contacto) salen de CACHE_PAGINAS
+        trabajo.compartido = bool(trabajo.hermanos) and sitio_de_hermanos(trabajo.club, website)
+        yield trabajo
+
+    def descubrir(trabajo):
+        with pool.usar() as driver:
+            principal, _ = cargar_pagina(driver, trabajo.website, ESPERA_PRINCIPAL)
+
+        # Verificar que el sitio cargó correctamente
+        if 'not found' in principal['titulo'].lower() or '404' in principal['titulo']:
+            trabajo.terminar('Sitio no disponible')
+            yield trabajo
+            return
+
+        trabajo.paginas.append(principal)
+        trabajo.frontera = FronteraClub()
+        trabajo.frontera.marcar_vista(trabajo.website)
+        trabajo.frontera.marcar_vista(principal['url'])
+        trabajo.frontera.agregar_enlaces(
+            extraer_enlaces(principal['html'], principal['url']),
+            trabajo.website, estrategia.mismo_dominio
+        )
+        yield trabajo
+
+    def descargar(trabajo):
+        frontera = trabajo.frontera
+        emails_principal, telefonos_principal = datos_pagina(trabajo.paginas[0])
+        encontrados = set(emails_principal)
+        telefonos = set(telefonos_principal)
+
+        with pool.usar() as driver:
+            while len(trabajo.paginas) <= estrategia.max_paginas:
+                if contactos_completos(trabajo.emails_propios(encontrados), telefonos):
+                    break
+
+                candidato = frontera.siguiente()
+                if candidato is None:
+                    break
+                url, keywords = candidato
+
+                try:
+                    pagina, descargada = cargar_pagina(driver, url, ESPERA_SECUNDARIA)
+                except Exception:
+                    continue
+                trabajo.paginas.append(pagina)
+
+                # Aprender qué palabras clave llevan a emails útiles. Las
+                # páginas del caché ya se contaron con el club que las bajó.
+                emails_pagina, telefonos_pagina = datos_pagina(pagina)
+                nuevos = set(emails_pagina) - encontrados
+                if descargada:
+                    TASAS.registrar(keywords, any(es_email_de_contacto(e) for e in nuevos))
+                encontrados |= nuevos
+                telefonos.update(telefonos_pagina)
+
+                # Los links de las páginas de staff también entran a la frontera
+                frontera.agregar_enlaces(
+                    extraer_enlaces(pagina['html'], pagina['url']),
+                    trabajo.website, estrategia.mismo_dominio
+                )
+
+        trabajo.frontera = None
+        yield trabajo
+
+    def extraer(trabajo):
+        emails, telefonos = set(), set()
+        for pagina in trabajo.paginas:
+            emails_pagina, telefonos_pagina = datos_pagina(pagina)
+            emails.update(emails_pagina)
+            telefonos.update(telefonos_pagina)
+
+        trabajo.emails = trabajo.emails_propios(emails)
+        trabajo.telefonos = list(telefonos)
+        # El HTML ya no hace falta: liberar memoria antes de seguir
+        trabajo.paginas = [{'url': p['url']} for p in trabajo.paginas]
+        yield trabajo
+
+    def clasificar(trabajo):
+        director_email, club_email = clasificar_emails(trabajo.emails)
+        trabajo.director_email = director_email or ''
+        trabajo.club_email = club_email or ''
+        trabajo.estado = 'OK' if trabajo.emails else 'Sin emails visibles'
+        yield trabajo
+
+    def al_fallar(trabajo, error):
+        trabajo.terminar(f'Error: {str(error)[:50]}')
+        yield trabajo
+
+    def etapa(nombre, procesar):
+        return Etapa(
+            nombre, procesar, workers=workers[nombre],
+            saltar=lambda t: t.terminado, al_fallar=al_fallar
+        )
+
+    return [
+        etapa('resolucion', resolver),
+        etapa('descubrimiento', descubrir),
+        etapa('descarga', descargar),
+        etapa('extraccion', extraer),
+        etapa('clasificacion', clasificar),
+    ]
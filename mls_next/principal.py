@@ -0,0 +1,72 @@
+"""
+Programa principal del scraper
+"""
+
+from .cache import CACHE_PAGINAS
+from .clubes import obtener_lista_clubes
+from .config import LIMITE, POOL_DRIVERS
+from .driver import PoolDrivers
+from .frontera import TASAS
+from .metricas import METRICAS, iniciar_servidor, puerto_desde_entorno
+from .motor import ejecutar
+from .pipeline import fuente_clubes, crear_etapas
+from .resolucion import ESTRATEGIAS
+from .salida import escribir_resultados
+from .trazado import volcar_perfil
+
+
+def main(estrategia='google', output_file=None,
+         limite=LIMITE, drivers=POOL_DRIVERS, workers=None,
+         titulo="MLS NEXT CLUB CONTACT SCRAPER", metricas_puerto=None):
+    if metricas_puerto is None:
+        metricas_puerto = puerto_desde_entorno()
+
+    print("="*60)
+    print(f"   {titulo}")
+    print(f"   (resolución: {estrategia})")
+    print("="*60)
+
+    estrategia = ESTRATEGIAS[estrategia]()
+    # Cada estrategia tiene su propio Excel para no pisar los resultados de la otra
+    output_file = output_file or estrategia.output_file
+    pool = PoolDrivers(drivers)
+
+    servidor = None
+    if metricas_puerto:
+        METRICAS.registrar_navegadores(pool.pids)
+        METRICAS.registrar_cache('paginas', CACHE_PAGINAS)
+        servidor = iniciar_servidor(metricas_puerto)
+
+    try:
+        clubes = obtener_lista_clubes()
+        if limite:
+            clubes = clubes[:limite]
+
+        print(f"\nProcesando {len(clubes)} clubes con {drivers} navegadores...")
+        print("-"*60)
+
+        trabajos = ejecutar(fuente_clubes(clubes), crear_etapas(estrategia, pool, workers))
+        resultados = escribir_resultados(trabajos, output_file, len(clubes))
+
+        # Estadísticas
+        print("\n" + "="*60)
+        print("   COMPLETADO!")
+        print("="*60)
+        print(f"Archivo guardado: {output_file}")
+        print(f"Total clubes: {len(resultados)}")
+        print(f"Con website: {len([r for r in resultados if r['Website']])}")
+        print(f"Con email: {len([r for r in resultados if r['Email Director'] or r['Email Club']])}")
+        con_website = [r['Paginas Revisadas'] for r in resultados if r['Paginas Revisadas']]
+        if con_website:
+            print(f"Promedio páginas por club: {sum(con_website) / len(con_website):.1f}")
+        print(f"Caché de páginas: {CACHE_PAGINAS.aciertos} aciertos, {CACHE_PAGINAS.fallos} descargas")
+
+        # Solo una corrida completa actualiza lo aprendido por la frontera
+        TASAS.guardar()
+
+    finally:
+        print("\nCerrando Chrome...")
+        pool.cerrar()
+        volcar_perfil()
+        if servidor:
+            servidor.shutdown()
@@ -0,0 +1,151 @@
+"""
+Estrategias de resolución de website
+====================================
+Cada estrategia recibe un driver y el nombre del club y devuelve la URL
+del sitio oficial (o None). Antes de pedir el driver, el pipeline llama a
+`esperar_turno()` para respetar el límite de la estrategia sin tener un
+navegador ocupado. Son intercambiables dentro del motor:
+
+    google   -> busca en Google (antes mls_next_scraper_v2.py)
+    dominio  -> prueba dominios armados con el nombre (antes mls_next_scraper.py)
+"""
+
+import re
+import threading
+import time
+from urllib.parse import urlparse
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+
+from .config import DELAY, INTERVALO_GOOGLE, DOMINIOS_IGNORAR, KEYWORDS_SOCCER
+
+
+class LimiteTasa:
+    """Espacia las llamadas al menos `intervalo` segundos entre sí,
+    aunque vengan de varios threads"""
+
+    def __init__(self, intervalo):
+        self.intervalo = intervalo
+        self._lock = threading.Lock()
+        self._proxima = 0.0
+
+    def esperar(self):
+        with self._lock:
+            ahora = time.monotonic()
+            turno = max(ahora, self._proxima)
+            self._proxima = turno + self.intervalo
+        time.sleep(turno - ahora)
+
+
+class EstrategiaGoogle:
+    """Busca el website del club en Google"""
+
+    nombre = 'google'
+    # Excel de salida por defecto
+    output_file = "mls_next_contacts_v2.xlsx"
+    # Páginas de contacto/staff a revisar por club
+    max_paginas = 5
+    mismo_dominio = True
+
+    # Compartido por todos los workers de resolución
+    limite = LimiteTasa(INTERVALO_GOOGLE)
+
+    def esperar_turno(self):
+        self.limite.esperar()
+
+    def resolver(self, driver, club_name):
+        try:
+            # Ir a Google
+            driver.get("https://www.google.com")
+            time.sleep(1)
+
+            try:
+                # Aceptar cookies si aparece
+                accept_btn = driver.find_elements(By.XPATH, "//button[contains(text(), 'Accept') or contains(text(), 'Acepto') or contains(text(), 'Aceptar')]")
+                if accept_btn:
+                    accept_btn[0].click()
+                    time.sleep(0.5)
+            except:
+                pass
+
+            # Buscar el club
+            search_box = driver.find_element(By.NAME, "q")
+            query = f"{club_name} soccer club official website"
+            search_box.clear()
+            search_box.send_keys(query)
+            search_box.send_keys(Keys.RETURN)
+
+            time.sleep(DELAY)
+
+            # Obtener resultados
+            resultados = driver.find_elements(By.CSS_SELECTOR, "div.g a")
+
+            for resultado in resultados[:10]:
+                try:
+                    href = resultado.get_attribute("href")
+                    if not href:
+                        continue
+
+                    # Verificar que no sea un dominio a ignorar
+                    dominio = urlparse(href).netloc.lower()
+                    if any(ignorar in dominio for ignorar in DOMINIOS_IGNORAR):
+                        continue
+
+                    # Verificar que sea un sitio real
+                    if href.startswith("http"):
+                        return href
+                except:
+                    continue
+
+        except Exception as e:
+            print(f"    Error buscando en Google: {e}")
+
+        return None
+
+
+class EstrategiaDominio:
+    """Intenta adivinar el website probando dominios con el nombre del club"""
+
+    nombre = 'dominio'
+    output_file = "mls_next_contacts.xlsx"
+    max_paginas = 1
+    mismo_dominio = False
+
+    def esperar_turno(self):
+        pass
+
+    def resolver(self, driver, club_name):
+        # Generar variaciones del nombre para URLs
+        slug = re.sub(r'[^a-z0-9]', '', club_name.lower())
+
+        urls_a_probar = [
+            f"https://www.{slug}.com",
+            f"https://www.{slug}soccer.com",
+            f"https://www.{slug}fc.com",
+            f"https://www.{slug}sc.com",
+            f"https://{slug}.com",
+            f"https://www.{slug}.org",
+        ]
+
+        for url in urls_a_probar:
+            try:
+                driver.get(url)
+                time.sleep(1.5)
+
+                # Verificar que no sea página de error
+                titulo = driver.title.lower()
+                if 'not found' not in titulo and '404' not in titulo and 'error' not in titulo:
+                    # Verificar que tenga contenido relacionado con soccer
+                    html = driver.page_source.lower()
+                    if any(word in html for word in KEYWORDS_SOCCER):
+                        return driver.current_url
+            except:
+                continue
+
+        return None
+
+
+ESTRATEGIAS = {
+    EstrategiaGoogle.nombre: EstrategiaGoogle,
+    EstrategiaDominio.nombre: EstrategiaDominio,
+}
@@ -0,0 +1,48 @@
+"""
+Salida de resultados a Excel
+"""
+
+import pandas as pd
+
+from .config import GUARDAR_CADA
+from .metricas import METRICAS
+
+
+def guardar_resultados(filas, filename):
+    """Guarda los resultados en Excel"""
+    df = pd.DataFrame(filas)
+    df.to_excel(filename, index=False, sheet_name='Contactos')
+
+
+def escribir_resultados(trabajos, output_file, total):
+    """Etapa final: consume los trabajos terminados y los guarda en Excel.
+
+    Muestra cada club a medida que termina, guarda el progreso cada
+    GUARDAR_CADA clubes y devuelve las filas en el orden original.
+    """
+    terminados = []
+
+    for i, trabajo in enumerate(trabajos, 1):
+        terminados.append(trabajo)
+        fila = trabajo.como_fila()
+        METRICAS.club_terminado(fallido=fila['Estado'].startswith('Error'))
+
+        print(f"\n[{i}/{total}] {trabajo.club}")
+        if fila['Website']:
+            print(f"    Website: {fila['Website']}")
+        if fila['Email Director'] or fila['Email Club']:
+            print(f"    ✓ Email: {fila['Email Director'] or fila['Email Club']}")
+        else:
+            print(f"    ✗ {fila['Estado']}")
+
+        # Guardar progreso
+        if i % GUARDAR_CADA == 0:
+            guardar_resultados(_ordenar(terminados), "progreso_" + output_file)
+
+    filas = _ordenar(terminados)
+    guardar_resultados(filas, output_file)
+    return filas
+
+
+def _ordenar(trabajos):
+    return [t.como_fila() for t in sorted(trabajos, key=lambda t: t.indice)]
@@ -0,0 +1,212 @@
+"""
+TRAZADO DE COMANDOS WEBDRIVER
+=============================
+Envoltorio opcional del driver de Chrome que registra cada comando remoto
+(get, find_elements, get_attribute, .text, page_source, title, ...) con su
+latencia y la función del scraper que lo disparó.
+
+Al terminar la corrida se genera:
+    - un perfil en formato "folded" (una línea "a;b;c microsegundos" por
+      pila) compatible con flamegraph.pl / speedscope / inferno
+    - una tabla de comandos por función en consola
+
+USO:
+    TRAZAR_WEBDRIVER=1 python -m mls_next
+"""
+
+import os
+import sys
+import time
+import threading
+from collections import defaultdict
+from inspect import getattr_static
+from selenium.webdriver.remote.webelement import WebElement
+
+# ============================================
+# CONFIGURACIÓN
+# ============================================
+
+TRAZAR_WEBDRIVER = os.environ.get('TRAZAR_WEBDRIVER') == '1'
+PERFIL_FILE = "perfil_webdriver.folded"
+
+# Solo los frames del proyecto cuentan como "función que llamó"
+_DIRECTORIO_PROYECTO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_ESTE_ARCHIVO = os.path.abspath(__file__)
+# El caché solo reenvía la carga: sus frames no aparecen en la pila
+_ARCHIVO_CACHE = os.path.join(os.path.dirname(_ESTE_ARCHIVO), 'cache.py')
+# Ayudantes de descarga: el comando se atribuye a la etapa que los llamó
+_AYUDANTES = {'cargar', 'cargar_pagina'}
+
+
+# ============================================
+# REGISTRO
+# ============================================
+
+class RegistroComandos:
+    """Acumula los comandos remotos de un driver (thread-safe)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # pila folded -> microsegundos acumulados
+        self.pilas = defaultdict(int)
+        # (función, comando) -> [cantidad, segundos]
+        self.por_funcion = defaultdict(lambda: [0, 0.0])
+
+    def registrar(self, comando, segundos):
+        pila = _pila_actual()
+        funcion = next((f for f in reversed(pila) if f not in _AYUDANTES), '<desconocida>')
+        folded = ';'.join(pila + [comando])
+
+        with self._lock:
+            self.pilas[folded] += max(1, int(segundos * 1_000_000))
+            stats = self.por_funcion[(funcion, comando)]
+            stats[0] += 1
+            stats[1] += segundos
+
+    def total_comandos(self):
+        with self._lock:
+            return sum(c for c, _ in self.por_funcion.values())
+
+    def guardar_perfil(self, filename):
+        with self._lock:
+            lineas = [f"{pila} {us}" for pila, us in sorted(self.pilas.items())]
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lineas) + '\n')
+
+    def imprimir_resumen(self):
+        with self._lock:
+            filas = sorted(self.por_funcion.items(), key=lambda x: -x[1][1])
+
+        print(f"{'Función':<28}{'Comando':<22}{'Cant.':>8}{'Total s':>10}{'Prom. ms':>10}")
+        print("-"*78)
+        for (funcion, comando), (cantidad, segundos) in filas:
+            promedio = segundos / cantidad * 1000 if cantidad else 0
+            print(f"{funcion:<28}{comando:<22}{cantidad:>8}{segundos:>10.2f}{promedio:>10.1f}")
+
+
+def _pila_actual():
+    """Funciones del proyecto en la pila actual, de la más externa a la más interna"""
+    pila = []
+    frame = sys._getframe(1)
+    while frame is not None:
+        archivo = os.path.abspath(frame.f_code.co_filename)
+        if archivo not in (_ESTE_ARCHIVO, _ARCHIVO_CACHE) and archivo.startswith(_DIRECTORIO_PROYECTO):
+            nombre = frame.f_code.co_name
+            if nombre != '<module>':
+                pila.append(nombre)
+        frame = frame.f_back
+    pila.reverse()
+    return pila
+
+
+# ============================================
+# ENVOLTORIOS
+# ============================================
+
+def _desenvolver(valor):
+    """Devuelve el objeto de Selenium real (para pasarlo de vuelta al driver)"""
+    if isinstance(valor, _Trazado):
+        return object.__getattribute__(valor, '_objetivo')
+    if isinstance(valor, (list, tuple)):
+        return type(valor)(_desenvolver(v) for v in valor)
+    return valor
+
+
+def _envolver(valor, registro):
+    """Envuelve los WebElement devueltos para seguir trazando sus comandos"""
+    if isinstance(valor, WebElement):
+        return ElementoTrazado(valor, registro)
+    if isinstance(valor, list) and valor and isinstance(valor[0], WebElement):
+        return [ElementoTrazado(v, registro) for v in valor]
+    return valor
+
+
+class _Trazado:
+    """Proxy que mide las propiedades y métodos públicos del objeto envuelto"""
+
+    def __init__(self, objetivo, registro):
+        object.__setattr__(self, '_objetivo', objetivo)
+        object.__setattr__(self, '_registro', registro)
+
+    def __getattr__(self, nombre):
+        objetivo = object.__getattribute__(self, '_objetivo')
+        registro = object.__getattribute__(self, '_registro')
+
+        if nombre.startswith('_'):
+            return getattr(objetivo, nombre)
+
+        # Las propiedades (page_source, title, text, ...) son comandos remotos
+        if isinstance(getattr_static(type(objetivo), nombre, None), property):
+            inicio = time.perf_counter()
+            try:
+                valor = getattr(objetivo, nombre)
+            finally:
+                registro.registrar(nombre, time.perf_counter() - inicio)
+            return _envolver(valor, registro)
+
+        valor = getattr(objetivo, nombre)
+        if not callable(valor):
+            return valor
+
+        def metodo_trazado(*args, **kwargs):
+            args = _desenvolver(args)
+            kwargs = {k: _desenvolver(v) for k, v in kwargs.items()}
+            inicio = time.perf_counter()
+            try:
+                resultado = valor(*args, **kwargs)
+            finally:
+                registro.registrar(nombre, time.perf_counter() - inicio)
+            return _envolver(resultado, registro)
+
+        return metodo_trazado
+
+    def __setattr__(self, nombre, valor):
+        setattr(object.__getattribute__(self, '_objetivo'), nombre, valor)
+
+    def __eq__(self, otro):
+        return object.__getattribute__(self, '_objetivo') == _desenvolver(otro)
+
+    def __hash__(self):
+        return hash(object.__getattribute__(self, '_objetivo'))
+
+
+class ElementoTrazado(_Trazado):
+    """WebElement trazado"""
+
+
+# Todos los drivers de la corrida (uno por worker) comparten el registro
+REGISTRO = RegistroComandos()
+
+
+class DriverTrazado(_Trazado):
+    """WebDriver trazado: todos los comandos quedan en `registro`"""
+
+    def __init__(self, driver, registro=REGISTRO):
+        super().__init__(driver, registro)
+
+    @property
+    def registro(self):
+        return object.__getattribute__(self, '_registro')
+
+
+def trazar_driver(driver):
+    """Envuelve el driver si TRAZAR_WEBDRIVER está activo"""
+    if not TRAZAR_WEBDRIVER:
+        return driver
+    print("Trazado de comandos WebDriver activado")
+    return DriverTrazado(driver)
+
+
+def volcar_perfil(registro=REGISTRO, filename=PERFIL_FILE):
+    """Guarda el perfil folded e imprime comandos por función (si hay trazado)"""
+    if not TRAZAR_WEBDRIVER:
+        return
+
+    registro.guardar_perfil(filename)
+
+    print("\n" + "="*60)
+    print("   COMANDOS WEBDRIVER")
+    print("="*60)
+    registro.imprimir_resumen()
+    print(f"\nTotal comandos: {registro.total_comandos()}")
+    print(f"Perfil guardado: {filename} (usar con flamegraph.pl o speedscope)")
@@ -0,0 +1,22 @@
+"""
+SERVICIO DE KPIs DEL DASHBOARD
+==============================
+Descarga los CSV publicados de Google Sheets (y los Excel del scraper de
+contactos), precalcula las estructuras que antes armaba el navegador en
+`fetchKpis` / `fetchKpisGender` y las sirve como un único JSON con ETag.
+
+USO:
+    python -m servicio_kpis
+    python -m servicio_kpis --puerto 8787 --refresco 300
+
+Luego en el .env del dashboard:
+    VITE_KPIS_API_URL="http://127.0.0.1:8787/api/kpis"
+"""
+
+from .kpis import calcular_kpis, calcular_kpis_gender, calcular_contactos
+from .servidor import DocumentoKpis, crear_documento, servir
+
+__all__ = [
+    'calcular_kpis', 'calcular_kpis_gender', 'calcular_contactos',
+    'DocumentoKpis', 'crear_documento', 'servir',
+]
@@ -0,0 +1,18 @@
+import argparse
+
+from .config import PUERTO, HOST, REFRESCO
+from .servidor import servir
+
+
+def _argumentos():
+    parser = argparse.ArgumentParser(prog='python -m servicio_kpis')
+    parser.add_argument('--puerto', type=int, default=PUERTO)
+    parser.add_argument('--host', default=HOST)
+    parser.add_argument('--refresco', type=int, default=REFRESCO,
+                        help='segundos entre revisiones de las fuentes')
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = _argumentos()
+    servir(puerto=args.puerto, host=args.host, intervalo=args.refresco)
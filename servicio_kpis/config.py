@@ -0,0 +1,47 @@
+"""
+Configuración del servicio de KPIs
+"""
+
+import os
+
+# Raíz del repo (donde están .env y los Excel del scraper)
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Puerto y host del servicio
+PUERTO = int(os.environ.get('KPIS_PUERTO') or 8787)
+HOST = os.environ.get('KPIS_HOST') or "127.0.0.1"
+
+# Cada cuántos segundos se revisan las fuentes (pedido condicional)
+REFRESCO = int(os.environ.get('KPIS_REFRESCO') or 300)
+
+# Cache-Control de las respuestas: el navegador revalida con If-None-Match
+# y el servidor contesta 304 si nada cambió
+CACHE_CONTROL = "public, max-age=60, must-revalidate"
+
+# Origen permitido para el dashboard (Vite en dev, Vercel en prod)
+CORS_ORIGEN = os.environ.get('KPIS_CORS_ORIGEN') or "*"
+
+# Variables del .env con los CSV publicados de Google Sheets
+VAR_KPIS = "VITE_SHEET_KPIS_CSV"
+VAR_KPIS_GENDER = "VITE_SHEET_KPIS_GENDER_CSV"
+
+# Salidas del scraper de contactos
+ARCHIVOS_CONTACTOS = ["mls_next_contacts.xlsx", "mls_next_contacts_v2.xlsx"]
+
+# Timeout de descarga de cada sheet (segundos)
+TIMEOUT = 20
+
+
+def leer_env(filename=os.path.join(RAIZ, '.env')):
+    """Lee el .env del dashboard (KEY="valor" por línea) sin pisar el entorno"""
+    valores = {}
+    if os.path.exists(filename):
+        with open(filename, encoding='utf-8') as f:
+            for linea in f:
+                linea = linea.strip()
+                if not linea or linea.startswith('#') or '=' not in linea:
+                    continue
+                clave, valor = linea.split('=', 1)
+                valores[clave.strip()] = valor.strip().strip('"').strip("'")
+    valores.update({k: v for k, v in os.environ.items() if k.startswith('VITE_')})
+    return valores
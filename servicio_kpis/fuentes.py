@@ -0,0 +1,103 @@
+"""
+Fuentes de datos con refresco incremental
+=========================================
+Cada fuente recuerda la versión que ya tiene (ETag / Last-Modified del
+sheet publicado, o mtime del Excel) y solo vuelve a descargar y parsear
+cuando cambió. Google no siempre respeta los pedidos condicionales, así
+que además se compara un hash del contenido.
+"""
+
+import csv
+import hashlib
+import io
+import os
+import urllib.error
+import urllib.request
+
+from .config import TIMEOUT
+
+try:
+    import pandas as pd
+except ImportError:  # opcional: sin pandas no se leen los Excel del scraper
+    pd = None
+
+
+class FuenteCSV:
+    """CSV publicado de Google Sheets"""
+
+    def __init__(self, nombre, url):
+        self.nombre = nombre
+        self.url = url
+        self.etag = None
+        self.last_modified = None
+        self.hash = None
+        self.filas = []
+
+    def actualizar(self):
+        """Descarga el CSV si cambió. Devuelve True si hay datos nuevos."""
+        if not self.url:
+            return False
+
+        pedido = urllib.request.Request(self.url)
+        if self.etag:
+            pedido.add_header('If-None-Match', self.etag)
+        if self.last_modified:
+            pedido.add_header('If-Modified-Since', self.last_modified)
+
+        try:
+            with urllib.request.urlopen(pedido, timeout=TIMEOUT) as respuesta:
+                contenido = respuesta.read()
+                self.etag = respuesta.headers.get('ETag')
+                self.last_modified = respuesta.headers.get('Last-Modified')
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return False
+            raise
+
+        digest = hashlib.sha256(contenido).hexdigest()
+        if digest == self.hash:
+            return False
+
+        self.hash = digest
+        self.filas = parse_csv(contenido.decode('utf-8-sig'))
+        return True
+
+
+class FuenteExcel:
+    """Excel de contactos generado por el scraper"""
+
+    def __init__(self, nombre, filename):
+        self.nombre = nombre
+        self.filename = filename
+        self.mtime = None
+        self.filas = []
+
+    def actualizar(self):
+        if pd is None or not os.path.exists(self.filename):
+            return False
+
+        mtime = os.path.getmtime(self.filename)
+        if mtime == self.mtime:
+            return False
+
+        self.mtime = mtime
+        self.filas = pd.read_excel(self.filename).fillna('').to_dict('records')
+        return True
+
+
+def parse_csv(texto):
+    """CSV -> lista de dicts usando la primera fila como headers.
+
+    Usa el módulo csv, así que respeta comas dentro de campos con comillas
+    (ej: "$3,000").
+    """
+    lector = csv.reader(io.StringIO(texto))
+    filas = [f for f in lector if any(c.strip() for c in f)]
+    if len(filas) < 2:
+        return []
+
+    headers = [h.strip() for h in filas[0]]
+    return [
+        {h: (fila[i].strip() if i < len(fila) else '') for i, h in enumerate(headers)}
+        for fila in filas[1:]
+    ]
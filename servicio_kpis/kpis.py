@@ -0,0 +1,101 @@
+"""
+Cálculo de las estructuras de KPIs
+==================================
+Devuelven exactamente lo mismo que `fetchKpis` (src/data/kpis.js) y
+`fetchKpisGender` (src/data/kpisGender.js), así el dashboard puede usar
+cualquiera de las dos fuentes sin cambios. Cada hoja usa la misma
+conversión a número que su versión JS: kpis.js quita "%", csv.js (la de
+KPIs_Gender) no.
+"""
+
+from collections import Counter
+
+
+def to_number(valor, quitar_porcentaje=True):
+    """Convierte "1,234" / "$1,234" / "56.2%" a número (0 si no se puede).
+
+    Con quitar_porcentaje=False se comporta como `toNumber` de csv.js:
+    "56.2%" no es un número y da 0.
+    """
+    texto = str(valor if valor is not None else '').strip()
+    texto = texto.replace('$', '').replace(',', '')
+    if quitar_porcentaje:
+        texto = texto.replace('%', '')
+    texto = texto.strip()
+    try:
+        n = float(texto)
+    except ValueError:
+        return 0
+    if n != n or n in (float('inf'), float('-inf')):
+        return 0
+    return int(n) if n.is_integer() else n
+
+
+def calcular_kpis(filas):
+    """Hoja KPIs: segment,totalLastYear,totalThisYear,...,avgFee"""
+    out = {}
+    for r in filas:
+        segment = (r.get('segment') or '').lower().strip()
+        if not segment:
+            continue
+
+        out[segment] = {
+            'totalLastYear': to_number(r.get('totalLastYear')),
+            'totalThisYear': to_number(r.get('totalThisYear')),
+            'netChange': to_number(r.get('netChange')),
+            'retained': to_number(r.get('retained')),
+            'lost': to_number(r.get('lost')),
+            'new': to_number(r.get('new')),
+            'avgFee': to_number(r.get('avgFee')) or 3000,
+        }
+    return out
+
+
+def _normalizar_segmento(s):
+    key = str(s or '').lower().strip()
+    if 'boy' in key:
+        return 'boys'
+    if 'girl' in key:
+        return 'girls'
+    return 'club'
+
+
+def _numero_gender(valor):
+    """Número de la hoja KPIs_Gender, igual que `toNumber` de csv.js"""
+    return to_number(valor, quitar_porcentaje=False)
+
+
+def calcular_kpis_gender(filas):
+    """Hoja KPIs_Gender: Segment, Total 24/25, Total 25/26, ..., Revenue Lost"""
+    data = {'club': None, 'boys': None, 'girls': None}
+
+    for r in filas:
+        seg = _normalizar_segmento(r.get('Segment'))
+        data[seg] = {
+            'totalLastYear': _numero_gender(r.get('Total 24/25')),
+            'totalThisYear': _numero_gender(r.get('Total 25/26')),
+            'netChange': _numero_gender(r.get('Net Change')),
+            'retained': _numero_gender(r.get('Retained')),
+            'lost': _numero_gender(r.get('Lost')),
+            'new': _numero_gender(r.get('New')),
+            'avgFee': _numero_gender(r.get('Avg Fee')),
+            'revenueLost': _numero_gender(r.get('Revenue Lost')),
+            'agedOut': _numero_gender(r.get('Aged Out')),
+        }
+
+    # fallback por si falta alguno
+    fallback = {
+        'totalLastYear': 0, 'totalThisYear': 0, 'netChange': 0, 'retained': 0,
+        'lost': 0, 'new': 0, 'avgFee': 0, 'revenueLost': 0, 'agedOut': 0,
+    }
+    return {seg: valores or dict(fallback) for seg, valores in data.items()}
+
+
+def calcular_contactos(filas):
+    """Resumen de un Excel del scraper de contactos"""
+    return {
+        'totalClubes': len(filas),
+        'conWebsite': sum(1 for r in filas if r.get('Website')),
+        'conEmail': sum(1 for r in filas if r.get('Email Director') or r.get('Email Club')),
+        'porEstado': dict(Counter(str(r.get('Estado') or 'Sin estado') for r in filas)),
+    }
@@ -0,0 +1,193 @@
+"""
+Servidor HTTP de KPIs precalculados
+===================================
+GET /api/kpis devuelve en un solo JSON compacto:
+
+    {
+      "kpis":       { club: {...}, boys: {...}, girls: {...} },
+      "kpisGender": { club: {...}, boys: {...}, girls: {...} },
+      "contactos":  { "mls_next_contacts_v2.xlsx": {...}, ... },
+      "actualizado": "2026-01-15T12:00:00Z"
+    }
+
+con ETag y Cache-Control. Si el navegador manda If-None-Match con el ETag
+vigente la respuesta es un 304 sin cuerpo. Hasta que los dos sheets de
+KPIs se descargan bien por primera vez la respuesta es un 503.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .config import (
+    RAIZ, PUERTO, HOST, REFRESCO, CACHE_CONTROL, CORS_ORIGEN, VAR_KPIS,
+    VAR_KPIS_GENDER, ARCHIVOS_CONTACTOS, leer_env
+)
+from .fuentes import FuenteCSV, FuenteExcel
+from .kpis import calcular_kpis, calcular_kpis_gender, calcular_contactos
+
+
+class DocumentoKpis:
+    """JSON precalculado del dashboard, reconstruido solo si cambia una fuente"""
+
+    def __init__(self, fuente_kpis, fuente_gender, fuentes_contactos):
+        self.fuente_kpis = fuente_kpis
+        self.fuente_gender = fuente_gender
+        self.fuentes_contactos = fuentes_contactos
+        self._secciones = {'kpis': {}, 'kpisGender': calcular_kpis_gender([]), 'contactos': {}}
+        self._lock = threading.Lock()
+        self.cuerpo = None
+        self.etag = None
+
+    def refrescar(self):
+        """Revisa cada fuente y recalcula solo las secciones que cambiaron"""
+        cambios = []
+
+        if self._actualizar(self.fuente_kpis):
+            self._secciones['kpis'] = calcular_kpis(self.fuente_kpis.filas)
+            cambios.append(self.fuente_kpis.nombre)
+
+        if self._actualizar(self.fuente_gender):
+            self._secciones['kpisGender'] = calcular_kpis_gender(self.fuente_gender.filas)
+            cambios.append(self.fuente_gender.nombre)
+
+        for fuente in self.fuentes_contactos:
+            if self._actualizar(fuente):
+                self._secciones['contactos'][fuente.nombre] = calcular_contactos(fuente.filas)
+                cambios.append(fuente.nombre)
+
+        # No se publica nada hasta tener los dos sheets de KPIs
+        if cambios and self.fuente_kpis.hash and self.fuente_gender.hash:
+            self._publicar()
+            print(f"[{datetime.now():%H:%M:%S}] Actualizado: {', '.join(cambios)} (ETag {self.etag})")
+        return cambios
+
+    def _actualizar(self, fuente):
+        try:
+            return fuente.actualizar()
+        except Exception as e:
+            # Si una fuente falla se sigue sirviendo la última versión buena
+            print(f"    Error actualizando {fuente.nombre}: {e}")
+            return False
+
+    def _publicar(self):
+        documento = dict(self._secciones)
+        documento['actualizado'] = datetime.now(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        cuerpo = json.dumps(documento, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+        # El ETag depende solo de los datos, no de la hora de actualización
+        datos = json.dumps(self._secciones, sort_keys=True).encode('utf-8')
+        etag = '"' + hashlib.sha256(datos).hexdigest()[:16] + '"'
+
+        with self._lock:
+            self.cuerpo, self.etag = cuerpo, etag
+
+    def actual(self):
+        """(cuerpo, etag) vigentes, o (None, None) si todavía no hay datos"""
+        with self._lock:
+            return self.cuerpo, self.etag
+
+
+def crear_documento(env=None):
+    env = env if env is not None else leer_env()
+    return DocumentoKpis(
+        FuenteCSV('kpis', env.get(VAR_KPIS)),
+        FuenteCSV('kpisGender', env.get(VAR_KPIS_GENDER)),
+        [FuenteExcel(nombre, os.path.join(RAIZ, nombre)) for nombre in ARCHIVOS_CONTACTOS],
+    )
+
+
+def _crear_handler(documento):
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def _cors(self):
+            self.send_header('Access-Control-Allow-Origin', CORS_ORIGEN)
+            self.send_header('Access-Control-Expose-Headers', 'ETag')
+            self.send_header('Vary', 'Origin')
+
+        def do_OPTIONS(self):
+            self.send_response(204)
+            self._cors()
+            self.send_header('Access-Control-Allow-Methods', 'GET, OPTIONS')
+            self.send_header('Access-Control-Allow-Headers', 'If-None-Match')
+            self.end_headers()
+
+        def do_GET(self):
+            if self.path.split('?')[0] != '/api/kpis':
+                self.send_error(404)
+                return
+
+            cuerpo, etag = documento.actual()
+            if cuerpo is None:
+                error = b'{"error":"KPIs todavia no disponibles"}'
+                self.send_response(503)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(error)))
+                self.send_header('Cache-Control', 'no-store')
+                self.send_header('Retry-After', '30')
+                self._cors()
+                self.end_headers()
+                self.wfile.write(error)
+                return
+
+            etags_cliente = [e.strip() for e in self.headers.get('If-None-Match', '').split(',')]
+
+            if etag in etags_cliente or '*' in etags_cliente:
+                self.send_response(304)
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', CACHE_CONTROL)
+                self._cors()
+                self.end_headers()
+                return
+
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(cuerpo)))
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', CACHE_CONTROL)
+            self._cors()
+            self.end_headers()
+            self.wfile.write(cuerpo)
+
+        def log_message(self, format, *args):
+            pass
+
+    return Handler
+
+
+def _refrescar_periodicamente(documento, intervalo, detener):
+    while not detener.wait(intervalo):
+        documento.refrescar()
+
+
+def servir(puerto=PUERTO, host=HOST, intervalo=REFRESCO):
+    """Precalcula los KPIs, los sirve y los refresca en segundo plano"""
+    print("="*60)
+    print("   SERVICIO DE KPIs DEL DASHBOARD")
+    print("="*60)
+
+    documento = crear_documento()
+    documento.refrescar()
+
+    detener = threading.Event()
+    threading.Thread(
+        target=_refrescar_periodicamente, args=(documento, intervalo, detener),
+        name='refresco', daemon=True
+    ).start()
+
+    servidor = ThreadingHTTPServer((host, puerto), _crear_handler(documento))
+    servidor.daemon_threads = True
+    print(f"KPIs en http://{host}:{servidor.server_port}/api/kpis (refresco cada {intervalo}s)")
+
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        detener.set()
+        servidor.server_close()
+        print("\nServicio detenido")
@@ -10,6 +10,7 @@ import {
   ArrowUpRight, ArrowDownRight
 } from "lucide-react";
 import * as XLSX from 'xlsx';
+import { fetchKpisGender, toDashboardKpis } from "./data/kpisGender";
 
 /* -------------------------------------------------------------------------- */
 /* CONFIGURATION                                                              */
@@ -23,7 +24,6 @@ const getEnvVar = (key) => {
 };
 
 const URLS = {
-  KPIS_GENDER: getEnvVar("VITE_SHEET_KPIS_GENDER_CSV"),
   PROGRAMS: getEnvVar("VITE_SHEET_PROGRAMS_CSV"),
   AGE: getEnvVar("VITE_SHEET_AGE_CSV"),
   TEAMS: getEnvVar("VITE_SHEET_TEAMS_CSV"),
@@ -256,31 +256,17 @@ export default function WayneDashboard({ onLogout }) {
       setLoading(true);
       try {
         const responses = await Promise.all([
-          fetch(URLS.KPIS_GENDER).then(res => res.text()),
+          // Servicio de KPIs si VITE_KPIS_API_URL está definido, si no el CSV
+          fetchKpisGender(),
           fetch(URLS.PROGRAMS).then(res => res.text()), // NEW: Fetch programs
           fetch(URLS.TEAMS).then(res => res.text()),
           fetch(URLS.PLAYERS).then(res => res.text()),
         ]);
 
-        const [kpiText, programText, teamText, playerText] = responses;
+        const [kpiData, programText, teamText, playerText] = responses;
 
         // KPIs
-        const kpiRows = rowsToObjects(parseCSV(kpiText));
-        const kpiMap = {};
-        kpiRows.forEach(r => {
-          const key = (pick(r, ["Segment", "segment"]) || "club").toLowerCase();
-          kpiMap[key] = {
-            totalLast: toNumber(pick(r, ["Total 24/25"])),
-            totalThis: toNumber(pick(r, ["Total 25/26"])),
-            net: toNumber(pick(r, ["Net Change"])),
-            retained: toNumber(pick(r, ["Retained"])),
-            lost: toNumber(pick(r, ["Lost"])),
-            new: toNumber(pick(r, ["New"])),
-            fee: toNumber(pick(r, ["Avg Fee"])) || 3000,
-            agedOut: toNumber(pick(r, ["Aged Out"])) || 0
-          };
-        });
-        setKpisGender(kpiMap);
+        setKpisGender(toDashboardKpis(kpiData));
 
         // NEW: Programs from new sheet structure
         // Columns: name, retained, lost, lastYear, thisYear, retentionRate, churn
@@ -1,5 +1,6 @@
 // src/data/kpis.js
-import { KPIS_URL } from "./sheet";
+import { KPIS_URL, KPIS_API_URL } from "./sheet";
+import { fetchKpisApi } from "./kpisApi";
 
 // Convierte "1,234" / "$1,234" / "56.2%" a número
 function toNumber(v) {
@@ -36,6 +37,8 @@ function parseCSV(text) {
  * segment: club | boys | girls
  */
 export async function fetchKpis() {
+  if (KPIS_API_URL) return (await fetchKpisApi()).kpis;
+
   const res = await fetch(KPIS_URL, { cache: "no-store" });
   if (!res.ok) throw new Error(`KPIS fetch failed: ${res.status}`);
   const csv = await res.text();
@@ -0,0 +1,32 @@
+// src/data/kpisApi.js
+import { KPIS_API_URL } from "./sheet";
+
+// Una sola petición por carga: fetchKpis y fetchKpisGender comparten la respuesta.
+let pending = null;
+
+/**
+ * Trae los KPIs ya calculados por el servicio Python (python -m servicio_kpis):
+ * { kpis, kpisGender, contactos, actualizado }
+ *
+ * `cache: "no-cache"` hace que el navegador revalide con If-None-Match;
+ * si nada cambió el servidor responde 304 y se usa la copia en caché.
+ */
+export function fetchKpisApi() {
+  if (!pending) {
+    pending = fetch(KPIS_API_URL, { cache: "no-cache" })
+      .then(res => {
+        if (!res.ok) throw new Error(`KPIS API fetch failed: ${res.status}`);
+        return res.json();
+      })
+      .then(data => {
+        // Igual que con los CSV: si falta una sección, fallar en lugar de devolver undefined
+        const missing = ["kpis", "kpisGender"].filter(k => !data?.[k]);
+        if (missing.length) throw new Error(`KPIS API missing: ${missing.join(", ")}`);
+        return data;
+      })
+      .finally(() => {
+        pending = null;
+      });
+  }
+  return pending;
+}
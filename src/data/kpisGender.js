@@ -1,5 +1,6 @@
 // src/data/kpisGender.js
-import { KPIS_GENDER_URL } from "./sheet";
+import { KPIS_GENDER_URL, KPIS_API_URL } from "./sheet";
+import { fetchKpisApi } from "./kpisApi";
 import { parseCSV, toNumber } from "./csv";
 
 function normalizeSegment(s) {
@@ -10,8 +11,10 @@ function normalizeSegment(s) {
 }
 
 // Espera columnas (como tu sheet):
-// Segment, Total 24/25, Total 25/26, Net Change, Retained, Lost, New, Avg Fee, Revenue Lost
+// Segment, Total 24/25, Total 25/26, Net Change, Retained, Lost, New, Avg Fee, Revenue Lost, Aged Out
 export async function fetchKpisGender() {
+  if (KPIS_API_URL) return (await fetchKpisApi()).kpisGender;
+
   const res = await fetch(KPIS_GENDER_URL, { cache: "no-store" });
   if (!res.ok) throw new Error(`KPIs_Gender fetch failed: ${res.status}`);
   const text = await res.text();
@@ -30,6 +33,7 @@ export async function fetchKpisGender() {
       new: toNumber(r["New"]),
       avgFee: toNumber(r["Avg Fee"]),
       revenueLost: toNumber(r["Revenue Lost"]), // opcional (si querés usarlo directo)
+      agedOut: toNumber(r["Aged Out"]),
     };
   }
 
@@ -43,6 +47,7 @@ export async function fetchKpisGender() {
     new: 0,
     avgFee: 0,
     revenueLost: 0,
+    agedOut: 0,
   };
 
   return {
@@ -51,3 +56,23 @@ export async function fetchKpisGender() {
     girls: data.girls ?? fallback,
   };
 }
+
+// Formato que usan los dashboards (WayneDashboard*.jsx): totalLast, totalThis, net, fee...
+// Los segmentos que no vienen en la hoja (solo el fallback en cero) se omiten.
+export function toDashboardKpis(data) {
+  const out = {};
+  for (const [seg, k] of Object.entries(data)) {
+    if (!k.totalLastYear && !k.totalThisYear) continue;
+    out[seg] = {
+      totalLast: k.totalLastYear,
+      totalThis: k.totalThisYear,
+      net: k.netChange,
+      retained: k.retained,
+      lost: k.lost,
+      new: k.new,
+      fee: k.avgFee || 3000,
+      agedOut: k.agedOut || 0,
+    };
+  }
+  return out;
+}
@@ -9,6 +9,10 @@ export const PLAYERS_URL = import.meta.env.VITE_SHEET_PLAYERS_CSV;
 // ✅ nuevo
 export const KPIS_GENDER_URL = import.meta.env.VITE_SHEET_KPIS_GENDER_CSV;
 
+// Opcional: servicio de KPIs precalculados (python -m servicio_kpis).
+// Si está definido, fetchKpis / fetchKpisGender lo usan en lugar de los CSV.
+export const KPIS_API_URL = import.meta.env.VITE_KPIS_API_URL;
+
 export function assertEnv() {
   const missing = [];
   if (!KPIS_URL) missing.push("VITE_SHEET_KPIS_CSV");